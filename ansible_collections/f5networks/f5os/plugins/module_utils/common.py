@@ -6,12 +6,12 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from ansible.module_utils.six import iteritems
-
 from ansible.module_utils.parsing.convert_bool import (
     BOOLEANS_TRUE, BOOLEANS_FALSE
 )
-from collections import defaultdict
+
+_TRUTHY = frozenset(BOOLEANS_TRUE) | frozenset(['enabled', 'True', 'true'])
+_FALSEY = frozenset(BOOLEANS_FALSE) | frozenset(['disabled', 'False', 'false'])
 
 
 def fq_name(partition, value, sub_path=''):
@@ -53,34 +53,32 @@ def fq_name(partition, value, sub_path=''):
         string: The fully qualified name, given the input parameters.
     """
     if value is not None and sub_path == '':
-        try:
-            int(value)
-            return '/{0}/{1}'.format(partition, value)
-        except (ValueError, TypeError):
-            if not value.startswith('/'):
-                return '/{0}/{1}'.format(partition, value)
+        if not isinstance(value, str) or not value.startswith('/'):
+            return f'/{partition}/{value}'
     if value is not None and sub_path != '':
-        try:
-            int(value)
-            return '/{0}/{1}/{2}'.format(partition, sub_path, value)
-        except (ValueError, TypeError):
-            if value.startswith('/'):
-                dummy, partition, name = value.split('/')
-                return '/{0}/{1}/{2}'.format(partition, sub_path, name)
-            if not value.startswith('/'):
-                return '/{0}/{1}/{2}'.format(partition, sub_path, value)
+        if not isinstance(value, str) or not value.startswith('/'):
+            return f'/{partition}/{sub_path}/{value}'
+        # Everything after the partition is the name, even if it holds
+        # further path elements.
+        parts = value.split('/', 2)
+        if len(parts) == 3:
+            dummy, partition, name = parts
+            return f'/{partition}/{sub_path}/{name}'
     return value
 
 
 def flatten_boolean(value):
-    truthy = list(BOOLEANS_TRUE) + ['enabled', 'True', 'true']
-    falsey = list(BOOLEANS_FALSE) + ['disabled', 'False', 'false']
     if value is None:
         return None
-    elif value in truthy:
-        return 'yes'
-    elif value in falsey:
-        return 'no'
+    try:
+        if value in _TRUTHY:
+            return 'yes'
+        elif value in _FALSEY:
+            return 'no'
+    except TypeError:
+        # Unhashable values, such as dicts or lists, are neither truthy
+        # nor falsey.
+        return None
 
 
 def merge_two_dicts(x, y):
@@ -89,14 +87,22 @@ def merge_two_dicts(x, y):
         copy. However, it does create a new object,
         so there's that.
     """
-    z = x.copy()
-    z.update(y)
-    return z
+    return {**x, **y}
+
+
+class _ParameterValues(dict):
+    """Dict returning None for missing keys, without storing them
+
+    Unlike defaultdict, a lookup of a missing key does not insert it,
+    so membership tests against ``_values`` only see real parameters.
+    """
+    def __missing__(self, key):
+        return None
 
 
 class AnsibleF5Parameters:
     def __init__(self, *args, **kwargs):
-        self._values = defaultdict(lambda: None)
+        self._values = _ParameterValues()
         self._values['__warnings'] = None
         self.client = kwargs.pop('client', None)
         self._module = kwargs.pop('module', None)
@@ -107,10 +113,27 @@ class AnsibleF5Parameters:
             self.update(params=params)
             self._params.update(params)
 
+    @classmethod
+    def _settable_properties(cls):
+        """Returns the names of the properties of the class that have a setter
+
+        The result is computed once per class and stored on it, so repeated
+        updates do not need to inspect class attributes for every parameter.
+        """
+        result = cls.__dict__.get('_settable_property_names')
+        if result is None:
+            result = frozenset(
+                name for name in dir(cls)
+                if isinstance(getattr(cls, name, None), property) and getattr(cls, name).fset is not None
+            )
+            cls._settable_property_names = result
+        return result
+
     def update(self, params=None):
         if params:
             self._params.update(params)
-            for k, v in iteritems(params):
+            settable = self._settable_properties()
+            for k, v in params.items():
                 if self.api_map is not None and k in self.api_map:
                     map_key = self.api_map[k]
                 else:
@@ -118,37 +141,30 @@ class AnsibleF5Parameters:
 
                 # Handle weird API parameters like `dns.proxy.__iter__` by
                 # using a map provided by the module developer
-                class_attr = getattr(type(self), map_key, None)
-                if isinstance(class_attr, property):
-                    # There is a mapped value for the api_map key
-                    if class_attr.fset is None:
-                        # If the mapped value does not have
-                        # an associated setter
-                        self._values[map_key] = v
-                    else:  # pragma: no cover
-                        # The mapped value has a setter
-                        setattr(self, map_key, v)
+                if map_key in settable:
+                    # The mapped value is a @property with a setter
+                    setattr(self, map_key, v)
                 else:
-                    # If the mapped value is not a @property
+                    # The mapped value is either not a @property, or has
+                    # no associated setter
                     self._values[map_key] = v
 
     def api_params(self):
+        api_map = self.api_map or {}
         result = {}
         for api_attribute in self.api_attributes:
-            if self.api_map is not None and api_attribute in self.api_map:
-                result[api_attribute] = getattr(self, self.api_map[api_attribute])
-            else:
-                result[api_attribute] = getattr(self, api_attribute)
-        result = self._filter_params(result)
+            value = getattr(self, api_map.get(api_attribute, api_attribute))
+            if value is not None:
+                result[api_attribute] = value
         return result
 
     def __getattr__(self, item):
         # Ensures that properties that weren't defined, and therefore stashed
         # in the `_values` dict, will be retrievable.
-        return self._values[item]
+        return self._values.get(item)
 
     def _filter_params(self, params):
-        return dict((k, v) for k, v in iteritems(params) if v is not None)
+        return dict((k, v) for k, v in params.items() if v is not None)
 
 
 class F5ModuleError(Exception):
@@ -8,7 +8,7 @@ __metaclass__ = type
 
 from unittest import TestCase
 from ansible_collections.f5networks.f5os.plugins.module_utils.common import (
-    fq_name, flatten_boolean, merge_two_dicts
+    fq_name, flatten_boolean, merge_two_dicts, AnsibleF5Parameters
 )
 
 
@@ -32,6 +32,21 @@ class TestFunctions(TestCase):
         res6 = fq_name('Foo', None)
         assert res6 is None
 
+        res7 = fq_name('Foo', 100, 'Bar')
+        assert res7 == '/Foo/Bar/100'
+
+        res7a = fq_name('Foo', 1.5)
+        assert res7a == '/Foo/1.5'
+
+        res7b = fq_name('Foo', 1.5, 'Bar')
+        assert res7b == '/Foo/Bar/1.5'
+
+        res8 = fq_name('Foo', '/Baz/Resource')
+        assert res8 == '/Baz/Resource'
+
+        res9 = fq_name('Foo', '/Baz/Sub/Resource', 'Bar')
+        assert res9 == '/Baz/Bar/Sub/Resource'
+
     def test_flatten_boolean(self):
         true = 'enabled'
         false = 'disabled'
@@ -39,10 +54,14 @@ class TestFunctions(TestCase):
         res1 = flatten_boolean(true)
         res2 = flatten_boolean(false)
         res3 = flatten_boolean(None)
+        res4 = flatten_boolean({'a': 1})
+        res5 = flatten_boolean(['enabled'])
 
         assert res1 == 'yes'
         assert res2 == 'no'
         assert res3 is None
+        assert res4 is None
+        assert res5 is None
 
     def test_merge_two_dics(self):
         first = dict(foo=1, bar=2)
@@ -50,3 +69,58 @@ class TestFunctions(TestCase):
         result = merge_two_dicts(first, second)
 
         assert result == {'foo': 1, 'bar': 2, 'baz': 3}
+
+
+class SetterParameters(AnsibleF5Parameters):
+    @property
+    def read_only(self):
+        return self._values['read_only']
+
+    @property
+    def doubled(self):
+        return self._values['doubled']
+
+    @doubled.setter
+    def doubled(self, value):
+        self._values['doubled'] = value * 2
+
+
+class SetterSubclassParameters(SetterParameters):
+    @property
+    def tripled(self):
+        return self._values['tripled']
+
+    @tripled.setter
+    def tripled(self, value):
+        self._values['tripled'] = value * 3
+
+
+class TestParameters(TestCase):
+    def test_missing_values_are_not_stored(self):
+        p = AnsibleF5Parameters(params=dict(foo='bar'))
+
+        assert p.foo == 'bar'
+        assert p.baz is None
+        assert p._values['qux'] is None
+        assert 'baz' not in p._values
+        assert 'qux' not in p._values
+
+    def test_update_uses_property_setters(self):
+        p = SetterParameters(params=dict(read_only=1, doubled=2, tripled=3))
+
+        assert p.read_only == 1
+        assert p.doubled == 4
+        assert p.tripled == 3
+        assert p._values['read_only'] == 1
+
+        s = SetterSubclassParameters(params=dict(read_only=1, doubled=2, tripled=3))
+
+        assert s.read_only == 1
+        assert s.doubled == 4
+        assert s.tripled == 9
+
+        assert SetterParameters._settable_properties() == frozenset(['doubled'])
+        assert SetterSubclassParameters._settable_properties() == frozenset(['doubled', 'tripled'])
+        assert 'tripled' not in SetterParameters.__dict__['_settable_property_names']
+        assert SetterSubclassParameters.__dict__['_settable_property_names'] is not \
+            SetterParameters.__dict__['_settable_property_names']
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2022, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import functools
+import json
+import os
+
+
+fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+@functools.lru_cache(maxsize=None)
+def load_fixture(name):
+    """Loads a fixture file, parsing it as JSON where possible
+
+    Results are cached for the whole test session and the same object is
+    handed out on every call, so tests must not mutate what they get back.
+    """
+    path = os.path.join(fixture_path, name)
+
+    with open(path) as f:
+        data = f.read()
+
+    try:
+        data = json.loads(data)
+    except Exception:
+        pass
+
+    return data
@@ -7,9 +7,6 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
-import json
-import os
-
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.f5networks.f5os.plugins.modules import f5os_interface
@@ -25,28 +22,7 @@ from ansible_collections.f5networks.f5os.tests.compat.mock import (
 from ansible_collections.f5networks.f5os.tests.modules.utils import (
     set_module_args, exit_json, fail_json, AnsibleFailJson, AnsibleExitJson
 )
-
-
-fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
-fixture_data = {}
-
-
-def load_fixture(name):
-    path = os.path.join(fixture_path, name)
-
-    if path in fixture_data:
-        return fixture_data[path]
-
-    with open(path) as f:
-        data = f.read()
-
-    try:
-        data = json.loads(data)
-    except Exception:
-        pass
-
-    fixture_data[path] = data
-    return data
+from ansible_collections.f5networks.f5os.tests.modules.network.f5._fixtures import load_fixture
 
 
 class DummyClient:
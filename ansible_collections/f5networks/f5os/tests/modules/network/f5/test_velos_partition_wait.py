@@ -6,9 +6,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import json
-import os
-import paramiko
+import datetime
 
 from ansible.module_utils.basic import AnsibleModule
 
@@ -25,28 +23,64 @@ from ansible_collections.f5networks.f5os.tests.compat.mock import (
 from ansible_collections.f5networks.f5os.tests.modules.utils import (
     set_module_args, exit_json, fail_json, AnsibleFailJson, AnsibleExitJson
 )
+from ansible_collections.f5networks.f5os.tests.modules.network.f5._fixtures import load_fixture
 
 
-fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
-fixture_data = {}
+base_args = dict(name='foo', state='running')
 
 
-def load_fixture(name):
-    path = os.path.join(fixture_path, name)
+def fixture_mock(name):
+    """Returns a new mock answering with the (cached) named fixture"""
+    return Mock(return_value=load_fixture(name))
 
-    if path in fixture_data:
-        return fixture_data[path]
 
-    with open(path) as f:
-        data = f.read()
+class FakeClock:
+    """Stands in for the time and datetime modules used by velos_partition_wait
 
-    try:
-        data = json.loads(data)
-    except Exception:
+    The clock only moves forward when sleep() is called, so the wait loop
+    runs without real delays and still reaches its timeout.
+    """
+    timedelta = datetime.timedelta
+
+    def __init__(self):
+        self.datetime = self
+        self.current = datetime.datetime(2022, 1, 1)
+
+    def now(self):
+        return self.current
+
+    def utcnow(self):
+        return self.current
+
+    def sleep(self, seconds):
+        self.current += datetime.timedelta(seconds=seconds)
+
+
+class FakeSSHClient:
+    """Minimal stand-in for paramiko.SSHClient
+
+    Each connect() call consumes the next of the given outcomes, raising
+    it if it is an exception and returning it otherwise.
+    """
+    def __init__(self, *outcomes):
+        self.outcomes = iter(outcomes)
+        self.connect_count = 0
+
+    def load_system_host_keys(self):
         pass
 
-    fixture_data[path] = data
-    return data
+    def set_missing_host_key_policy(self, policy):
+        pass
+
+    def connect(self, *args, **kwargs):
+        self.connect_count += 1
+        outcome = next(self.outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self):
+        pass
 
 
 class TestParameters(unittest.TestCase):
@@ -71,44 +105,50 @@ class TestParameters(unittest.TestCase):
 
 
 class TestModuleManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.spec = ArgumentSpec()
+        cls.mock_module_helper = patch.multiple(AnsibleModule,
+                                                exit_json=exit_json,
+                                                fail_json=fail_json)
+        cls.mock_module_helper.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock_module_helper.stop()
+
     def setUp(self):
-        self.spec = ArgumentSpec()
-        self.mock_module_helper = patch.multiple(AnsibleModule,
-                                                 exit_json=exit_json,
-                                                 fail_json=fail_json)
-        self.mock_module_helper.start()
         self.p1 = patch('ansible_collections.f5networks.f5os.plugins.modules.velos_partition_wait.F5Client')
         self.m1 = self.p1.start()
         self.m1.return_value = Mock()
         self.p2 = patch('ansible_collections.f5networks.f5os.plugins.modules.velos_partition_wait.send_teem')
         self.m2 = self.p2.start()
         self.m2.return_value = True
+        self.clock = FakeClock()
+        self.p3 = patch.multiple(velos_partition_wait, datetime=self.clock, time=self.clock)
+        self.p3.start()
 
-    def teardown(self):
+    def tearDown(self):
         self.p1.stop()
         self.p2.stop()
-        self.mock_module_helper.stop()
-
-    def test_wait_running(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            timeout=100,
-            delay=1
-        ))
+        self.p3.stop()
 
-        module = AnsibleModule(
+    def create_module(self, args):
+        set_module_args(args)
+        return AnsibleModule(
             argument_spec=self.spec.argument_spec,
             supports_check_mode=self.spec.supports_check_mode
         )
 
+    def test_wait_running(self, *args):
+        module = self.create_module(dict(base_args, timeout=10, delay=1))
+
         # Override methods to force specific logic in the module to happen
         mm = ModuleManager(module=module)
         # Simulate the tenant is not present until the 3rd loop iteration at
         # which time it is present and in the configured state.
         mm.partition_exists = Mock(side_effect=[False, False, True])
-        configured_state = load_fixture('load_partition_status_provisioned.json')
-        mm.read_partition_from_device = Mock(return_value=configured_state)
+        mm.read_partition_from_device = fixture_mock('load_partition_status_provisioned.json')
 
         results = mm.exec_module()
 
@@ -117,194 +157,106 @@ class TestModuleManager(unittest.TestCase):
         self.assertTrue(mm.read_partition_from_device.called)
 
     def test_wait_ssh_ready(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='ssh-ready',
-            timeout=100,
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
+        module = self.create_module(dict(base_args, state='ssh-ready', timeout=10))
 
         # Override methods to force specific logic in the module to happen
         mm = ModuleManager(module=module)
-        mm.partition_exists = Mock(side_effect=[True, True])
-        deployed_state = load_fixture('load_partition_status_provisioned.json')
-        mm.read_partition_from_device = Mock(return_value=deployed_state)
+        mm.partition_exists = Mock(return_value=True)
+        mm.read_partition_from_device = fixture_mock('load_partition_status_provisioned.json')
 
         # Simulate the first ssh connection attempt raises an SSHException
         # indicating ssh is not ready, followed by a second connection which
         # raises AuthenticationException, indicating ssh server is up.
-        with patch.object(paramiko, 'SSHClient', autospec=True) as mock_ssh:
-            mocked_client = Mock()
-            attrs = {
-                'connect.side_effect': [
-                    paramiko.ssh_exception.SSHException,
-                    paramiko.ssh_exception.AuthenticationException
-                ]
-            }
-            mocked_client.configure_mock(**attrs)
+        with patch.object(velos_partition_wait.paramiko, 'SSHClient') as mock_ssh:
+            ssh_exception = velos_partition_wait.paramiko.ssh_exception
+            mocked_client = FakeSSHClient(ssh_exception.SSHException(), ssh_exception.AuthenticationException())
             mock_ssh.return_value = mocked_client
 
             results = mm.exec_module()
 
         self.assertFalse(results['changed'])
         self.assertEqual(mm.partition_exists.call_count, 2)
-        self.assertEqual(mocked_client.connect.call_count, 2)
+        self.assertEqual(mocked_client.connect_count, 2)
 
     def test_wait_ssh_ready_ipv6(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='ssh-ready',
-            timeout=100,
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
+        module = self.create_module(dict(base_args, state='ssh-ready', timeout=10))
 
         # Override methods to force specific logic in the module to happen
         mm = ModuleManager(module=module)
-        mm.partition_exists = Mock(side_effect=[True, True])
-        deployed_state = load_fixture('load_partition_status_provisioned_ipv6.json')
-        mm.read_partition_from_device = Mock(return_value=deployed_state)
+        mm.partition_exists = Mock(return_value=True)
+        mm.read_partition_from_device = fixture_mock('load_partition_status_provisioned_ipv6.json')
 
         # Simulate the first ssh connection attempt raises an SSHException
         # indicating ssh is not ready, followed by a second connection which
         # raises AuthenticationException, indicating ssh server is up.
-        with patch.object(paramiko, 'SSHClient', autospec=True) as mock_ssh:
-            mocked_client = Mock()
-            attrs = {
-                'connect.side_effect': [
-                    paramiko.ssh_exception.SSHException,
-                    paramiko.ssh_exception.AuthenticationException
-                ]
-            }
-            mocked_client.configure_mock(**attrs)
+        with patch.object(velos_partition_wait.paramiko, 'SSHClient') as mock_ssh:
+            ssh_exception = velos_partition_wait.paramiko.ssh_exception
+            mocked_client = FakeSSHClient(ssh_exception.SSHException(), ssh_exception.AuthenticationException())
             mock_ssh.return_value = mocked_client
 
             results = mm.exec_module()
 
         self.assertFalse(results['changed'])
         self.assertEqual(mm.partition_exists.call_count, 2)
-        self.assertEqual(mocked_client.connect.call_count, 2)
+        self.assertEqual(mocked_client.connect_count, 2)
 
     def test_wait_ssh_ready_no_auth_exception(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='ssh-ready',
-            timeout=100,
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
+        module = self.create_module(dict(base_args, state='ssh-ready', timeout=10))
 
         # Override methods to force specific logic in the module to happen
         mm = ModuleManager(module=module)
-        mm.partition_exists = Mock(side_effect=[True, True])
-        deployed_state = load_fixture('load_partition_status_provisioned.json')
-        mm.read_partition_from_device = Mock(return_value=deployed_state)
+        mm.partition_exists = Mock(return_value=True)
+        mm.read_partition_from_device = fixture_mock('load_partition_status_provisioned.json')
 
         # Simulate the first ssh connection attempt raises an SSHException
         # indicating ssh is not ready, followed by a second connection which
         # raises AuthenticationException, indicating ssh server is up.
-        with patch.object(paramiko, 'SSHClient', autospec=True) as mock_ssh:
-            mocked_client = Mock()
-            attrs = {
-                'connect.side_effect': [
-                    paramiko.ssh_exception.SSHException,
-                    True
-                ]
-            }
-            mocked_client.configure_mock(**attrs)
+        with patch.object(velos_partition_wait.paramiko, 'SSHClient') as mock_ssh:
+            ssh_exception = velos_partition_wait.paramiko.ssh_exception
+            mocked_client = FakeSSHClient(ssh_exception.SSHException(), True)
             mock_ssh.return_value = mocked_client
 
             results = mm.exec_module()
 
         self.assertFalse(results['changed'])
         self.assertEqual(mm.partition_exists.call_count, 2)
-        self.assertEqual(mocked_client.connect.call_count, 2)
+        self.assertEqual(mocked_client.connect_count, 2)
 
     def test_timeout_elapsed(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            timeout=2
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
+        module = self.create_module(dict(base_args, timeout=2))
 
         # Override methods to force specific logic in the module to happen
         mm = ModuleManager(module=module)
-        mm.partition_exists = Mock(side_effect=[False, False, False])
+        mm.partition_exists = Mock(return_value=False)
 
         with self.assertRaises(AnsibleFailJson) as err:
             mm.exec_module()
 
         self.assertIn('Timeout waiting for desired partition state', err.exception.args[0]['msg'])
 
-    def test_invalid_timeout(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            delay=1,
-            sleep=3,
-            timeout=2
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
+    def test_invalid_timing_arguments(self, *args):
+        cases = [
+            (dict(delay=1, sleep=3, timeout=2), 'The combined delay and sleep should not be greater than'),
+            (dict(delay=2, sleep=2, timeout=1), 'The delay should not be greater than or equal to the timeout'),
+        ]
 
-        # Override methods to force specific logic in the module to happen
-        mm = ModuleManager(module=module)
-        mm.partition_exists = Mock(side_effect=[False, False, False])
+        for timing, expected in cases:
+            with self.subTest(**timing):
+                module = self.create_module(dict(base_args, **timing))
 
-        with self.assertRaises(F5ModuleError) as err:
-            mm.exec_module()
+                # Override methods to force specific logic in the module to happen
+                mm = ModuleManager(module=module)
+                mm.partition_exists = Mock(return_value=False)
 
-        self.assertIn('The combined delay and sleep should not be greater than', err.exception.args[0])
+                with self.assertRaises(F5ModuleError) as err:
+                    mm.exec_module()
 
-    def test_invalid_delay_timeout(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            delay=2,
-            sleep=2,
-            timeout=1
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
-
-        # Override methods to force specific logic in the module to happen
-        mm = ModuleManager(module=module)
-        mm.partition_exists = Mock(side_effect=[False, False, False])
-
-        with self.assertRaises(F5ModuleError) as err:
-            mm.exec_module()
-
-        self.assertIn('The delay should not be greater than or equal to the timeout', err.exception.args[0])
+                self.assertIn(expected, err.exception.args[0])
 
     @patch.object(velos_partition_wait, 'Connection')
     @patch.object(velos_partition_wait.ModuleManager, 'exec_module', Mock(return_value={'changed': False}))
     def test_main_function_success(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            timeout=2
-        ))
+        set_module_args(dict(base_args, timeout=2))
 
         with self.assertRaises(AnsibleExitJson) as result:
             velos_partition_wait.main()
@@ -316,11 +268,7 @@ class TestModuleManager(unittest.TestCase):
                   Mock(side_effect=F5ModuleError('This module has failed.'))
                   )
     def test_main_function_failed(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            timeout=2
-        ))
+        set_module_args(dict(base_args, timeout=2))
 
         with self.assertRaises(AnsibleFailJson) as result:
             velos_partition_wait.main()
@@ -333,11 +281,7 @@ class TestModuleManager(unittest.TestCase):
                   Mock(side_effect=F5ModuleError('This module has failed.'))
                   )
     def test_main_paramiko_missing(self, *args):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            timeout=2
-        ))
+        set_module_args(dict(base_args, timeout=2))
 
         with self.assertRaises(AnsibleFailJson) as result:
             velos_partition_wait.HAS_PARAMIKO = False
@@ -348,16 +292,7 @@ class TestModuleManager(unittest.TestCase):
         self.assertIn('Failed to import the required Python library (paramiko)', result.exception.args[0]['msg'])
 
     def test_device_call_functions(self):
-        set_module_args(dict(
-            name='foo',
-            state='running',
-            timeout=100
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode
-        )
+        module = self.create_module(dict(base_args, timeout=100))
 
         mm = ModuleManager(module=module)
 